@@ -1,3 +1,4 @@
+import sys
 from copy import copy
 from warnings import warn
 from functools import reduce
@@ -140,14 +141,28 @@ class Table(Selectable):
         query_cls: Optional[Type["Query"]] = None,
     ) -> None:
         super().__init__(alias)
-        self._table_name = name
+        self._table_name = sys.intern(name) if type(name) is str else name
         self._schema = self._init_schema(schema)
         self._query_cls = query_cls or Query
         self._for = None
         self._for_portion = None
+        self._fields = {}
         if not issubclass(self._query_cls, Query):
             raise TypeError("Expected 'query_cls' to be subclass of Query")
 
+    def __copy__(self) -> "Table":
+        newone = type(self).__new__(type(self))
+        newone.__dict__.update(self.__dict__)
+        # Cached fields reference this table, so the copy must build its own
+        newone._fields = {}
+        return newone
+
+    def field(self, name: str) -> Field:
+        field = self._fields.get(name)
+        if field is None:
+            field = self._fields[name] = super().field(name)
+        return field
+
     def get_table_name(self) -> str:
         return self.alias or self._table_name
 
@@ -188,6 +203,9 @@ class Table(Selectable):
         return self.get_sql(quote_char='"')
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Table):
             return False
 
@@ -211,7 +229,10 @@ class Table(Selectable):
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        # Hash on name and alias rather than rendering the table's SQL on every lookup. _schema is deliberately left
+        # out: Schema defines __eq__ without __hash__ and so is unhashable. Equal tables still share a name and alias,
+        # so this stays consistent with __eq__.
+        return hash((self._table_name, self.alias))
 
     def select(self, *terms: Sequence[Union[int, float, str, bool, Term, Field]]) -> "QueryBuilder":
         """
@@ -814,6 +835,9 @@ class QueryBuilder(Selectable, Term):
         :return:
             A copy of the query with the tables replaced.
         """
+        if current_table is new_table:
+            return self
+
         self._from = [new_table if table == current_table else table for table in self._from]
         self._insert_table = new_table if self._insert_table == current_table else self._insert_table
         self._update_table = new_table if self._update_table == current_table else self._update_table
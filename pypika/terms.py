@@ -1,6 +1,8 @@
 import inspect
 import re
+import sys
 import uuid
+from copy import copy
 from datetime import date
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Sequence, Set, Type, TypeVar, Union
@@ -538,7 +540,8 @@ class Field(Criterion, JSON):
         self, name: str, alias: Optional[str] = None, table: Optional[Union[str, "Selectable"]] = None
     ) -> None:
         super().__init__(alias=alias)
-        self.name = name
+        # Field names are repeated across many terms and queries, so intern them to share a single string object
+        self.name = sys.intern(name) if type(name) is str else name
         self.table = table
 
     def nodes_(self) -> Iterator[NodeT]:
@@ -1105,6 +1108,12 @@ class Case(Criterion):
         self._cases = []
         self._else = None
 
+    def __copy__(self) -> "Case":
+        newone = type(self).__new__(type(self))
+        newone.__dict__.update(self.__dict__)
+        newone._cases = copy(self._cases)
+        return newone
+
     def nodes_(self) -> Iterator[NodeT]:
         yield self
 
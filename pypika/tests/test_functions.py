@@ -485,6 +485,13 @@ class ConditionTests(unittest.TestCase):
             str(q),
         )
 
+    def test__case__when_does_not_modify_original(self):
+        case = Case().when(F("foo") > 0, F("fiz"))
+        extended = case.when(F("bar") <= 0, F("buz"))
+
+        self.assertEqual('CASE WHEN "foo">0 THEN "fiz" END', str(case))
+        self.assertEqual('CASE WHEN "foo">0 THEN "fiz" WHEN "bar"<=0 THEN "buz" END', str(extended))
+
     def test__case__no_cases(self):
         with self.assertRaises(CaseException):
             q = Q.from_("abc").select(Case())
@@ -13,6 +13,46 @@ class TableStructureTests(unittest.TestCase):
 
         self.assertEqual('"test_table"', str(table))
 
+    def test_table_name_is_interned(self):
+        name = "".join(["test_", "table"])
+
+        self.assertIs("test_table", Table(name)._table_name)
+
+    def test_table_name_str_subclass(self):
+        class Name(str):
+            pass
+
+        table = Table(Name("test_table"))
+
+        self.assertIsInstance(table._table_name, Name)
+        self.assertEqual('"test_table"', str(table))
+
+    def test_table_field_access_returns_same_field(self):
+        table = Table("test_table")
+
+        self.assertIs(table.foo, table.foo)
+        self.assertIs(table.foo, table["foo"])
+
+    def test_aliased_table_copy_does_not_share_fields(self):
+        table = Table("test_table")
+        table.foo
+        aliased = table.as_("my_table")
+
+        self.assertIs(aliased, aliased.foo.table)
+        self.assertEqual('"my_table"."foo"', str(aliased.foo))
+        self.assertEqual('"foo"', str(table.foo))
+
+    def test_builder_call_on_table_does_not_cache_fields(self):
+        table = Table("test_table")
+        table.as_("my_table")
+
+        self.assertEqual({}, table._fields)
+
+    def test_table_column_named_immutable(self):
+        table = Table("test_table")
+
+        self.assertEqual('SELECT "immutable" FROM "test_table"', str(Query.from_(table).select(table.immutable)))
+
     def test_table_with_alias(self):
         table = Table("test_table").as_("my_table")
 
@@ -75,6 +115,12 @@ class TableStructureTests(unittest.TestCase):
 
 
 class TableEqualityTests(unittest.TestCase):
+    def test_table_equal_to_itself(self):
+        t = Table("t", schema="a", alias="x")
+
+        self.assertEqual(t, t)
+        self.assertFalse(t != t)
+
     def test_tables_equal_by_name(self):
         t1 = Table("t")
         t2 = Table("t")
@@ -102,6 +148,13 @@ class TableEqualityTests(unittest.TestCase):
 
         self.assertEqual(t1, t2)
 
+    def test_equal_tables_have_equal_hashes(self):
+        t1 = Table("t", schema="a", alias="x")
+        t2 = Table("t", schema="a", alias="x")
+
+        self.assertEqual(hash(t1), hash(t2))
+        self.assertEqual({t1}, {t2})
+
     def test_tables_not_equal_by_schema_and_name_using_schema_with_different_parents(
         self,
     ):
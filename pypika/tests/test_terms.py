@@ -15,6 +15,20 @@ class FieldAliasTests(TestCase):
         self.assertEqual('bar', str(c1.alias))
 
 
+class FieldNameTests(TestCase):
+    def test_field_name_is_interned(self):
+        name = "".join(["na", "me"])
+        self.assertIs("name", Field(name).name)
+
+    def test_field_name_str_subclass(self):
+        class Name(str):
+            pass
+
+        field = Field(Name("name"))
+        self.assertIsInstance(field.name, Name)
+        self.assertEqual('"name"', field.get_sql(quote_char='"'))
+
+
 class FieldHashingTests(TestCase):
     def test_tabled_eq_fields_equally_hashed(self):
         client_name1 = Field(name="name", table=Table("clients"))
@@ -46,7 +46,9 @@ def builder(func: Callable) -> Callable:
     import copy
 
     def _copy(self, *args, **kwargs):
-        self_copy = copy.copy(self) if getattr(self, "immutable", True) else self
+        # Read the instance dict directly: classes with __getattr__ (e.g. Table) would otherwise answer this lookup with
+        # a Field named "immutable"
+        self_copy = copy.copy(self) if self.__dict__.get("immutable", True) else self
         result = func(self_copy, *args, **kwargs)
 
         # Return self if the inner function returns None.  This way the inner function can return something